@@ -1,15 +1,34 @@
-from flask import Flask, render_template, request, redirect, url_for, jsonify, flash, Response
+from flask import Flask, render_template, request, redirect, url_for, flash, Response, g, abort
 import csv
+import heapq
 from io import StringIO
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
+import orjson
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import defer, joinedload, raiseload, selectinload
+from sqlalchemy.schema import CreateIndex
 from datetime import datetime
-import json
 from collections import defaultdict
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor
 
 import os
+import sqlite3
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'sire-cup-secret-key-2026')
+debug_mode = os.environ.get('FLASK_DEBUG') == '1'
+
+# Outside development, templates never change under a running process, so
+# skip the per-render mtime checks and keep compiled templates on disk
+if not debug_mode:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    # Jinja's default directory is private to this user (0700, owner-checked)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 # Use PostgreSQL on Render, SQLite locally
 database_url = os.environ.get('DATABASE_URL', 'sqlite:///sirecup.db')
@@ -18,7 +37,24 @@ if database_url.startswith('postgres://'):
     database_url = database_url.replace('postgres://', 'postgresql://', 1)
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Bigger compiled-statement cache and a persistent pool that survives idle drops
+engine_options = {'query_cache_size': 1200, 'pool_pre_ping': True, 'pool_recycle': 3600}
+if database_url.startswith('postgresql://'):
+    engine_options.update(pool_size=10, max_overflow=20)
+elif database_url.startswith('sqlite'):
+    # Threaded workers and the query pool share pooled connections
+    engine_options['connect_args'] = {'check_same_thread': False, 'timeout': 30}
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
 db = SQLAlchemy(app)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})
+
+@event.listens_for(Engine, 'connect')
+def set_sqlite_wal(dbapi_connection, connection_record):
+    # WAL lets readers keep going while a write is in progress
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.close()
 
 # Register datetime.utcnow as a global function for Jinja2 templates
 app.jinja_env.globals.update(now=datetime.utcnow)
@@ -30,18 +66,18 @@ class Player(db.Model):
     handicap = db.Column(db.Float, nullable=False)
     team = db.Column(db.String(50), nullable=True)
     is_captain = db.Column(db.Boolean, default=False)
-    travel_plans = db.relationship('TravelPlan', backref='player', lazy=True, cascade="all, delete-orphan")
-    carpool_memberships = db.relationship('CarpoolMember', backref='player', lazy=True, cascade="all, delete-orphan")
-    round_scores = db.relationship('PlayerRoundScore', backref='player', lazy=True, cascade="all, delete-orphan")
+    travel_plans = db.relationship('TravelPlan', backref='player', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
+    carpool_memberships = db.relationship('CarpoolMember', backref='player', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
+    round_scores = db.relationship('PlayerRoundScore', backref='player', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
     paid_expenses = db.relationship('Expense', foreign_keys='[Expense.payer_id]', backref='payer', lazy=True)
-    participating_expenses = db.relationship('ExpenseParticipant', backref='player', lazy=True, cascade="all, delete-orphan")
+    participating_expenses = db.relationship('ExpenseParticipant', backref='player', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f'<Player {self.name}>'
 
 class TravelPlan(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete='CASCADE'), nullable=False)
     arrival_date = db.Column(db.DateTime, nullable=False)
     arrival_time = db.Column(db.String(50), nullable=True)
     airport_name = db.Column(db.String(100), nullable=True)
@@ -50,6 +86,8 @@ class TravelPlan(db.Model):
     departure_time = db.Column(db.String(50), nullable=True)
     notes = db.Column(db.Text, nullable=True)
 
+    __table_args__ = (db.Index('ix_travelplan_arrival', 'arrival_date', 'arrival_time'),)
+
     def __repr__(self):
         return f'<TravelPlan {self.player.name} {self.arrival_date} to {self.departure_date}>'
 
@@ -58,15 +96,15 @@ class CarpoolGroup(db.Model):
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=True)
     max_members = db.Column(db.Integer, nullable=True)
-    members = db.relationship('CarpoolMember', backref='carpool_group', lazy=True, cascade="all, delete-orphan")
+    members = db.relationship('CarpoolMember', backref='carpool_group', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f'<CarpoolGroup {self.name}>'
 
 class CarpoolMember(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    carpool_id = db.Column(db.Integer, db.ForeignKey('carpool_group.id'), nullable=False)
-    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False, unique=True)
+    carpool_id = db.Column(db.Integer, db.ForeignKey('carpool_group.id', ondelete='CASCADE'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete='CASCADE'), nullable=False, unique=True)
 
     def __repr__(self):
         return f'<CarpoolMember {self.player.name} in {self.carpool_group.name}>'
@@ -74,36 +112,34 @@ class CarpoolMember(db.Model):
 class Course(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), unique=True, nullable=False)
-    pars = db.Column(db.Text, nullable=False)
-    rounds = db.relationship('Round', backref='course', lazy=True, cascade="all, delete-orphan")
-
-    def get_pars_list(self):
-        return json.loads(self.pars)
+    pars = db.Column(db.JSON, nullable=False)
+    rounds = db.relationship('Round', backref='course', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f'<Course {self.name}>'
 
 class Round(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    course_id = db.Column(db.Integer, db.ForeignKey('course.id'), nullable=False)
+    course_id = db.Column(db.Integer, db.ForeignKey('course.id', ondelete='CASCADE'), nullable=False)
     date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     notes = db.Column(db.Text, nullable=True)
     team1_score = db.Column(db.Integer, nullable=True)
     team2_score = db.Column(db.Integer, nullable=True)
-    scores = db.relationship('PlayerRoundScore', backref='round', lazy=True, cascade="all, delete-orphan")
+    scores = db.relationship('PlayerRoundScore', backref='round', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (db.Index('ix_round_date', 'date'),)
 
     def __repr__(self):
         return f"<Round on {self.course.name} on {self.date.strftime('%Y-%m-%d')}>"
 
 class PlayerRoundScore(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    round_id = db.Column(db.Integer, db.ForeignKey('round.id'), nullable=False)
-    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
-    hole_scores = db.Column(db.Text, nullable=False)
+    round_id = db.Column(db.Integer, db.ForeignKey('round.id', ondelete='CASCADE'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete='CASCADE'), nullable=False)
+    hole_scores = db.Column(db.JSON, nullable=False)
     total_score = db.Column(db.Integer, nullable=False)
 
-    def get_hole_scores_list(self):
-        return json.loads(self.hole_scores)
+    __table_args__ = (db.Index('ix_playerroundscore_round_id', 'round_id'),)
 
     def __repr__(self):
         return f'<PlayerRoundScore {self.player.name} Total: {self.total_score}>'
@@ -115,15 +151,17 @@ class Expense(db.Model):
     payer_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
     date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     notes = db.Column(db.Text, nullable=True)
-    participants = db.relationship('ExpenseParticipant', backref='expense', lazy=True, cascade="all, delete-orphan")
+    participants = db.relationship('ExpenseParticipant', backref='expense', lazy=True, cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (db.Index('ix_expense_date', 'date'),)
 
     def __repr__(self):
         return f'<Expense {self.description} by {self.payer.name} for {self.amount}>'
 
 class ExpenseParticipant(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    expense_id = db.Column(db.Integer, db.ForeignKey('expense.id'), nullable=False)
-    player_id = db.Column(db.Integer, db.ForeignKey('player.id'), nullable=False)
+    expense_id = db.Column(db.Integer, db.ForeignKey('expense.id', ondelete='CASCADE'), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey('player.id', ondelete='CASCADE'), nullable=False)
 
     __table_args__ = (db.UniqueConstraint('expense_id', 'player_id', name='_expense_player_uc'),)
 
@@ -132,15 +170,15 @@ class ExpenseParticipant(db.Model):
 
 class Match(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    round_id = db.Column(db.Integer, db.ForeignKey('round.id'), nullable=True)
+    round_id = db.Column(db.Integer, db.ForeignKey('round.id', ondelete='SET NULL'), nullable=True)
     date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     format = db.Column(db.String(50), nullable=False)  # singles, fourball, foursomes, scramble
     status = db.Column(db.String(20), nullable=False, default='scheduled')  # scheduled, in_progress, completed
     
     # Team 1 players (JSON list of player IDs)
-    team1_player_ids = db.Column(db.Text, nullable=False)
+    team1_player_ids = db.Column(db.JSON, nullable=False)
     # Team 2 players (JSON list of player IDs)
-    team2_player_ids = db.Column(db.Text, nullable=False)
+    team2_player_ids = db.Column(db.JSON, nullable=False)
     
     # Results
     team1_points = db.Column(db.Float, nullable=True)  # 0, 0.5, or 1 (for ties/halves)
@@ -148,11 +186,7 @@ class Match(db.Model):
     result_description = db.Column(db.String(100), nullable=True)  # e.g., "3&2", "1 up", "A/S"
     notes = db.Column(db.Text, nullable=True)
 
-    def get_team1_players(self):
-        return json.loads(self.team1_player_ids)
-    
-    def get_team2_players(self):
-        return json.loads(self.team2_player_ids)
+    __table_args__ = (db.Index('ix_match_status_date', 'status', 'date'),)
 
     def __repr__(self):
         return f'<Match {self.format} on {self.date}>'
@@ -165,6 +199,8 @@ class Announcement(db.Model):
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     pinned = db.Column(db.Boolean, default=False)
 
+    __table_args__ = (db.Index('ix_announcement_pinned_created', 'pinned', 'created_at'),)
+
     def __repr__(self):
         return f'<Announcement {self.title}>'
 
@@ -177,9 +213,11 @@ class ScheduleEvent(db.Model):
     end_time = db.Column(db.String(20), nullable=True)
     location = db.Column(db.String(200), nullable=True)
     event_type = db.Column(db.String(50), nullable=False, default='general')  # golf, dinner, activity, travel, general
-    course_id = db.Column(db.Integer, db.ForeignKey('course.id'), nullable=True)
+    course_id = db.Column(db.Integer, db.ForeignKey('course.id', ondelete='SET NULL'), nullable=True)
     notes = db.Column(db.Text, nullable=True)
 
+    __table_args__ = (db.Index('ix_event_date_start', 'event_date', 'start_time'),)
+
     def __repr__(self):
         return f'<ScheduleEvent {self.title} on {self.event_date}>'
 
@@ -189,20 +227,16 @@ class TripInfo(db.Model):
     dates = db.Column(db.String(100), nullable=False, default="October 23-27, 2026")
     location = db.Column(db.String(200), nullable=False, default="Pebble Beach, CA")
     message = db.Column(db.Text, nullable=False, default="Get ready for another epic Sire Cup! Handicaps are in, travel plans are shaping up, and the trash talk has already begun. Let's make some memories (and maybe a few birdies).")
-    nav_links = db.Column(db.Text, nullable=False)
-    team_names = db.Column(db.Text, nullable=False, default=json.dumps(["Team Augusta", "Team Magnolia"]))
-
-    def get_nav_links_list(self):
-        return json.loads(self.nav_links)
-
-    def get_team_names_list(self):
-        return json.loads(self.team_names)
+    nav_links = db.Column(db.JSON, nullable=False)
+    team_names = db.Column(db.JSON, nullable=False, default=["Team Augusta", "Team Magnolia"])
 
     def __repr__(self):
         return f'<TripInfo {self.title}>'
 
-# Create tables automatically on startup
-with app.app_context():
+# Create tables and apply in-place schema migrations. The DDL takes table
+# locks on PostgreSQL, so it runs once per deploy from build.sh rather than
+# in every worker; set RUN_MIGRATIONS=1 to also run it at import time.
+def run_migrations():
     db.create_all()
     # Add departure_time column if it doesn't exist (migration)
     try:
@@ -211,9 +245,33 @@ with app.app_context():
             conn.commit()
     except Exception:
         pass  # Column already exists
+    # Add declared indexes to tables created before they existed (migration)
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+    # Convert JSON stored as text to native JSON on PostgreSQL; the ::json
+    # cast rejects any row that doesn't parse (migration)
+    if db.engine.dialect.name == 'postgresql':
+        with db.engine.begin() as conn:
+            inspector = db.inspect(conn)
+            for table in db.metadata.sorted_tables:
+                current_types = {c['name']: c['type'] for c in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if isinstance(column.type, db.JSON) and not isinstance(current_types.get(column.name), db.JSON):
+                        conn.execute(db.text(
+                            f'ALTER TABLE "{table.name}" ALTER COLUMN "{column.name}" '
+                            f'TYPE JSON USING "{column.name}"::json'
+                        ))
+
+if os.environ.get('RUN_MIGRATIONS') == '1':
+    with app.app_context():
+        run_migrations()
 
-# Helper to get/create trip info
+# Helper to get/create trip info (looked up once per request)
 def get_or_create_trip_info():
+    if 'trip_info' in g:
+        return g.trip_info
     trip_info = TripInfo.query.first()
     if not trip_info:
         default_links = [
@@ -225,37 +283,189 @@ def get_or_create_trip_info():
             {"text": "Manage Expenses", "url": "/expenses"},
             {"text": "Settle Up", "url": "/settle_up"},
         ]
-        trip_info = TripInfo(nav_links=json.dumps(default_links))
+        trip_info = TripInfo(nav_links=default_links)
         db.session.add(trip_info)
         db.session.commit()
+    g.trip_info = trip_info
     return trip_info
 
+# TripInfo changes a few times per tournament but is read on nearly every
+# page, so each process keeps a plain-dict snapshot of it. Editing the row
+# bumps the version and drops the snapshot; a load that raced with an edit
+# is not stored.
+_trip_cache = {'v': 0, 'data': None}
+
+def get_trip_info_data():
+    data = _trip_cache['data']
+    if data is None:
+        version = _trip_cache['v']
+        trip_info = get_or_create_trip_info()
+        data = {
+            'title': trip_info.title,
+            'dates': trip_info.dates,
+            'location': trip_info.location,
+            'message': trip_info.message,
+            'nav_links': trip_info.nav_links,
+            'team_names': trip_info.team_names,
+        }
+        if _trip_cache['v'] == version:
+            _trip_cache['data'] = data
+    return data
+
+def invalidate_trip_info_cache():
+    _trip_cache['v'] += 1
+    _trip_cache['data'] = None
+
+# Player id -> (id, name) row lookup for pages that resolve the player ids
+# stored on matches. It is reused until the (max id, count) token moves or a
+# player route invalidates it, so most requests cost one aggregate query.
+_players_cache = {'v': 0, 'token': None, 'dict': {}}
+
+def get_players_dict():
+    token = tuple(db.session.query(func.max(Player.id), func.count(Player.id)).one())
+    if token != _players_cache['token']:
+        version = _players_cache['v']
+        players_dict = {p.id: p for p in db.session.query(Player.id, Player.name)}
+        if _players_cache['v'] != version:
+            return players_dict
+        _players_cache['dict'] = players_dict
+        _players_cache['token'] = token
+    return _players_cache['dict']
+
+def invalidate_players_cache():
+    _players_cache['v'] += 1
+    _players_cache['token'] = None
+
+# Thread pool for running a page's independent queries side by side. Each
+# task pushes its own app context, so it gets its own session and pooled
+# connection; the session is removed (and its objects detached) when the
+# task finishes.
+query_pool = ThreadPoolExecutor(max_workers=4)
+
+def run_in_app_context(fn):
+    with app.app_context():
+        return fn()
+
+# Delete a row by id with a single DELETE (no SELECT, no ORM cascades).
+# Child rows are covered by ON DELETE CASCADE, but routes still delete them
+# explicitly first: SQLite doesn't enforce foreign keys by default, and
+# tables created before the cascade was declared don't have it.
+def delete_or_404(model, object_id):
+    deleted = db.session.execute(db.delete(model).where(model.id == object_id)).rowcount
+    db.session.commit()
+    if not deleted:
+        abort(404)
+
+def conditional_page(html):
+    # No timestamps to derive Last-Modified from, so tag the rendered page;
+    # no-cache makes browsers revalidate, and an unchanged page costs a 304
+    response = app.make_response(html)
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+def bulk_create(model, rows):
+    # One executemany INSERT; committing is left to the caller so the rows
+    # land in the same transaction as whatever they belong to
+    if rows:
+        db.session.execute(db.insert(model), rows)
+
+# Shared-cache entries keyed by a generation the write routes bump after
+# committing. A load that overlapped a write stores under the old key,
+# which nothing reads again, so it can't resurrect stale rows.
+_cache_generations = {'course_choices': 0, 'ann_list': 0, 'standings': 0}
+
+def get_cached(name, timeout, load):
+    key = f"{name}:{_cache_generations[name]}"
+    value = cache.get(key)
+    if value is None:
+        value = load()
+        cache.set(key, value, timeout=timeout)
+    return value
+
+def bump_cache_generation(name):
+    _cache_generations[name] += 1
+
+# Course dropdown rows for the event forms; the course routes bump the
+# generation whenever they change a course
+def get_course_choices():
+    return get_cached('course_choices', 300, lambda: db.session.query(
+        Course.id, Course.name).order_by(Course.name).all())
+
+# Loader options for list queries; in debug, any relationship left lazy
+# raises instead of quietly issuing one query per row
+def eager(*options):
+    if app.debug:
+        options += (raiseload('*'),)
+    return options
+
+# Helper to total team points over completed matches in a single query
+def get_match_standings():
+    return db.session.query(
+        func.coalesce(func.sum(Match.team1_points), 0).label('team1_points'),
+        func.coalesce(func.sum(Match.team2_points), 0).label('team2_points'),
+        func.count(Match.id).label('matches_played')
+    ).filter(Match.status == 'completed').one()
+
+# JSON payload for /api/standings. Scoreboards poll it, so it is cached
+# briefly; match and team-name changes bump the 'standings' generation
+def get_standings_payload():
+    def load():
+        team_names = get_trip_info_data()['team_names']
+        standings = get_match_standings()
+        return {
+            'team1': {'name': team_names[0] if len(team_names) > 0 else 'Team 1', 'points': standings.team1_points},
+            'team2': {'name': team_names[1] if len(team_names) > 1 else 'Team 2', 'points': standings.team2_points},
+            'matches_played': standings.matches_played
+        }
+    return get_cached('standings', 10, load)
+
+
+# Pinned-first announcements as plain dicts; the announcement routes bump
+# the generation whenever one changes
+def get_announcements_list():
+    def load():
+        rows = db.session.query(
+            Announcement.id, Announcement.title, Announcement.content,
+            Announcement.author, Announcement.created_at, Announcement.pinned
+        ).order_by(Announcement.pinned.desc(), Announcement.created_at.desc()).all()
+        return [row._asdict() for row in rows]
+    return get_cached('ann_list', 600, load)
+
 
 # Routes
 @app.route('/')
 def index():
-    trip_info = get_or_create_trip_info()
-    players = Player.query.all()
-    courses = Course.query.all()
-    rounds = Round.query.all()
+    trip_info = get_trip_info_data()
+
+    # None of these depend on each other, so overlap their round trips
+    players = query_pool.submit(run_in_app_context, lambda: Player.query.all())
+    counts = query_pool.submit(run_in_app_context, lambda: (
+        db.session.query(func.count(Course.id)).scalar(),
+        db.session.query(func.count(Round.id)).scalar()
+    ))
     
     # Get match standings
-    matches_list = Match.query.all()
-    team1_points = sum(m.team1_points or 0 for m in matches_list if m.status == 'completed')
-    team2_points = sum(m.team2_points or 0 for m in matches_list if m.status == 'completed')
+    standings = query_pool.submit(run_in_app_context, lambda: (
+        db.session.query(func.count(Match.id)).scalar(),
+        *get_match_standings()
+    ))
     
     # Get recent announcements
-    recent_announcements = Announcement.query.order_by(Announcement.pinned.desc(), Announcement.created_at.desc()).limit(3).all()
+    recent_announcements = query_pool.submit(run_in_app_context, lambda: get_announcements_list()[:3])
     
+    courses_count, rounds_count = counts.result()
+    match_count, team1_points, team2_points, matches_played = standings.result()
     return render_template('index.html', 
-                          players=players, 
+                          players=players.result(), 
                           agenda=trip_info, 
-                          courses=courses, 
-                          rounds=rounds,
-                          matches=matches_list,
+                          courses_count=courses_count, 
+                          rounds_count=rounds_count,
+                          match_count=match_count,
+                          matches_played=matches_played,
                           team1_points=team1_points,
                           team2_points=team2_points,
-                          announcements=recent_announcements)
+                          announcements=recent_announcements.result())
 
 @app.route('/edit_trip_info', methods=['GET', 'POST'])
 def edit_trip_info():
@@ -266,15 +476,16 @@ def edit_trip_info():
         trip_info.location = request.form['location']
         trip_info.message = request.form['message']
         team_names_str = request.form['team_names']
-        trip_info.team_names = json.dumps([name.strip() for name in team_names_str.split(',') if name.strip()])
+        trip_info.team_names = [name.strip() for name in team_names_str.split(',') if name.strip()]
         db.session.commit()
+        invalidate_trip_info_cache()
+        bump_cache_generation('standings')
         return redirect(url_for('index'))
     return render_template('edit_trip_info.html', trip_info=trip_info)
 
 @app.route('/add_player', methods=['GET', 'POST'])
 def add_player():
-    trip_info = get_or_create_trip_info()
-    teams = trip_info.get_team_names_list()
+    teams = get_trip_info_data()['team_names']
     if request.method == 'POST':
         name = request.form['name']
         handicap = float(request.form['handicap'])
@@ -283,14 +494,14 @@ def add_player():
         new_player = Player(name=name, handicap=handicap, team=team, is_captain=is_captain)
         db.session.add(new_player)
         db.session.commit()
+        invalidate_players_cache()
         return redirect(url_for('index'))
     return render_template('add_player.html', teams=teams)
 
 @app.route('/edit_player/<int:player_id>', methods=['GET', 'POST'])
 def edit_player(player_id):
     player = Player.query.get_or_404(player_id)
-    trip_info = get_or_create_trip_info()
-    teams = trip_info.get_team_names_list()
+    teams = get_trip_info_data()['team_names']
 
     if request.method == 'POST':
         player.name = request.form['name']
@@ -298,14 +509,15 @@ def edit_player(player_id):
         player.team = request.form['team'] if request.form['team'] else None
         player.is_captain = bool(request.form.get('is_captain'))
         db.session.commit()
+        invalidate_players_cache()
         return redirect(url_for('index'))
     
     return render_template('edit_player.html', player=player, teams=teams)
 
 @app.route('/travel')
 def travel():
-    travel_plans = TravelPlan.query.order_by(TravelPlan.arrival_date, TravelPlan.arrival_time).all()
-    players = Player.query.all()
+    travel_plans = TravelPlan.query.options(*eager(joinedload(TravelPlan.player))).order_by(TravelPlan.arrival_date, TravelPlan.arrival_time).all()
+    players = db.session.query(Player.id, Player.name).all()
     return render_template('travel.html', travel_plans=travel_plans, players=players)
 
 @app.route('/add_travel_plan/<int:player_id>', methods=['GET', 'POST'])
@@ -320,8 +532,8 @@ def add_travel_plan(player_id):
         departure_time = request.form.get('departure_time', '')
         notes = request.form['notes']
 
-        arrival_date = datetime.strptime(arrival_str, '%Y-%m-%d')
-        departure_date = datetime.strptime(departure_str, '%Y-%m-%d')
+        arrival_date = datetime.fromisoformat(arrival_str)
+        departure_date = datetime.fromisoformat(departure_str)
 
         new_plan = TravelPlan(
             player_id=player.id,
@@ -342,11 +554,11 @@ def add_travel_plan(player_id):
 def edit_travel_plan(plan_id):
     plan = TravelPlan.query.get_or_404(plan_id)
     if request.method == 'POST':
-        plan.arrival_date = datetime.strptime(request.form['arrival_date'], '%Y-%m-%d')
+        plan.arrival_date = datetime.fromisoformat(request.form['arrival_date'])
         plan.arrival_time = request.form['arrival_time']
         plan.airport_name = request.form['airport_name']
         plan.flight_number = request.form['flight_number']
-        plan.departure_date = datetime.strptime(request.form['departure_date'], '%Y-%m-%d')
+        plan.departure_date = datetime.fromisoformat(request.form['departure_date'])
         plan.departure_time = request.form.get('departure_time', '')
         plan.notes = request.form['notes']
         db.session.commit()
@@ -355,16 +567,14 @@ def edit_travel_plan(plan_id):
 
 @app.route('/delete_travel_plan/<int:plan_id>')
 def delete_travel_plan(plan_id):
-    plan = TravelPlan.query.get_or_404(plan_id)
-    db.session.delete(plan)
-    db.session.commit()
+    delete_or_404(TravelPlan, plan_id)
     return redirect(url_for('travel'))
 
 # --- Carpool Routes ---
 @app.route('/carpools')
 def carpools():
-    carpool_groups = CarpoolGroup.query.all()
-    players_not_in_carpool = Player.query.filter(~Player.carpool_memberships.any()).all()
+    carpool_groups = CarpoolGroup.query.options(*eager(selectinload(CarpoolGroup.members).joinedload(CarpoolMember.player))).all()
+    players_not_in_carpool = Player.query.outerjoin(CarpoolMember, CarpoolMember.player_id == Player.id).filter(CarpoolMember.id.is_(None)).all()
     return render_template('carpools.html', carpool_groups=carpool_groups, players_not_in_carpool=players_not_in_carpool)
 
 @app.route('/create_carpool', methods=['GET', 'POST'])
@@ -382,20 +592,16 @@ def create_carpool():
 
 @app.route('/join_carpool/<int:carpool_id>/<int:player_id>')
 def join_carpool(carpool_id, player_id):
-    existing_membership = CarpoolMember.query.filter_by(player_id=player_id).first()
-    if existing_membership:
-        db.session.delete(existing_membership)
-
-    new_membership = CarpoolMember(carpool_id=carpool_id, player_id=player_id)
-    db.session.add(new_membership)
+    # Move an existing membership in place; only insert if the player had none
+    updated = CarpoolMember.query.filter_by(player_id=player_id).update({'carpool_id': carpool_id})
+    if not updated:
+        db.session.add(CarpoolMember(carpool_id=carpool_id, player_id=player_id))
     db.session.commit()
     return redirect(url_for('carpools'))
 
 @app.route('/leave_carpool/<int:membership_id>')
 def leave_carpool(membership_id):
-    membership = CarpoolMember.query.get_or_404(membership_id)
-    db.session.delete(membership)
-    db.session.commit()
+    delete_or_404(CarpoolMember, membership_id)
     return redirect(url_for('carpools'))
 
 # --- Course & Round Routes ---
@@ -413,13 +619,13 @@ def add_course():
             pars_list = [int(p.strip()) for p in pars_str.split(',') if p.strip()]
             if len(pars_list) != 18:
                 raise ValueError("Please enter 18 pars, comma-separated.")
-            pars_json = json.dumps(pars_list)
-        except (ValueError, json.JSONDecodeError) as e:
+        except ValueError as e:
             return render_template('add_course.html', error=str(e), name=name, pars=pars_str)
 
-        new_course = Course(name=name, pars=pars_json)
+        new_course = Course(name=name, pars=pars_list)
         db.session.add(new_course)
         db.session.commit()
+        bump_cache_generation('course_choices')
         return redirect(url_for('courses'))
     return render_template('add_course.html')
 
@@ -434,31 +640,35 @@ def edit_course(course_id):
             if len(pars_list) != 18:
                 raise ValueError("Please enter 18 pars, comma-separated.")
             course.name = name
-            course.pars = json.dumps(pars_list)
+            course.pars = pars_list
             db.session.commit()
+            bump_cache_generation('course_choices')
             return redirect(url_for('courses'))
-        except (ValueError, json.JSONDecodeError) as e:
+        except ValueError as e:
             return render_template('edit_course.html', course=course, error=str(e))
     return render_template('edit_course.html', course=course)
 
 @app.route('/delete_course/<int:course_id>')
 def delete_course(course_id):
-    course = Course.query.get_or_404(course_id)
-    db.session.delete(course)
-    db.session.commit()
+    round_ids = db.select(Round.id).where(Round.course_id == course_id)
+    db.session.execute(db.delete(PlayerRoundScore).where(PlayerRoundScore.round_id.in_(round_ids)))
+    db.session.execute(db.update(Match).where(Match.round_id.in_(round_ids)).values(round_id=None))
+    db.session.execute(db.delete(Round).where(Round.course_id == course_id))
+    db.session.execute(db.update(ScheduleEvent).where(ScheduleEvent.course_id == course_id).values(course_id=None))
+    delete_or_404(Course, course_id)
+    bump_cache_generation('course_choices')
     return redirect(url_for('courses'))
 
 @app.route('/rounds')
 def rounds():
-    rounds = Round.query.order_by(Round.date.desc()).all()
+    rounds = Round.query.options(*eager(defer(Round.notes), joinedload(Round.course), selectinload(Round.scores))).order_by(Round.date.desc()).all()
     courses = Course.query.all()
-    players = Player.query.all()
-    return render_template('rounds.html', rounds=rounds, courses=courses, players=players)
+    return render_template('rounds.html', rounds=rounds, courses=courses)
 
 @app.route('/log_round/<int:course_id>', methods=['GET', 'POST'])
 def log_round(course_id):
     course = Course.query.get_or_404(course_id)
-    players = Player.query.all()
+    players = db.session.query(Player.id, Player.name, Player.handicap).all()
 
     if request.method == 'POST':
         round_notes = request.form.get('round_notes')
@@ -466,6 +676,8 @@ def log_round(course_id):
         db.session.add(new_round)
         db.session.flush()
 
+        pars_list = course.pars
+        score_rows = []
         for player in players:
             hole_scores = []
             total_score = 0
@@ -477,39 +689,42 @@ def log_round(course_id):
                     score = int(score_val)
                     player_scores_entered = True
                 else:
-                    score = course.get_pars_list()[i-1]
+                    score = pars_list[i-1]
                 hole_scores.append(score)
                 total_score += score
             
             if player_scores_entered:
-                new_player_score = PlayerRoundScore(
-                    round_id=new_round.id,
-                    player_id=player.id,
-                    hole_scores=json.dumps(hole_scores),
-                    total_score=total_score
-                )
-                db.session.add(new_player_score)
+                score_rows.append({
+                    'round_id': new_round.id,
+                    'player_id': player.id,
+                    'hole_scores': hole_scores,
+                    'total_score': total_score
+                })
         
+        bulk_create(PlayerRoundScore, score_rows)
         db.session.commit()
         return redirect(url_for('rounds'))
 
-    return render_template('log_round.html', course=course, players=players, course_pars=course.get_pars_list())
+    return render_template('log_round.html', course=course, players=players, course_pars=course.pars)
 
 @app.route('/view_round_scores/<int:round_id>')
 def view_round_scores(round_id):
     round_data = Round.query.get_or_404(round_id)
-    player_scores = PlayerRoundScore.query.filter_by(round_id=round_id).all()
+    player_scores = PlayerRoundScore.query.options(*eager(joinedload(PlayerRoundScore.player))).filter_by(round_id=round_id).all()
     return render_template('view_round_scores.html', round_data=round_data, player_scores=player_scores)
 
 # --- Expense Routes ---
 @app.route('/expenses')
 def expenses():
-    expenses_list = Expense.query.order_by(Expense.date.desc()).all()
+    expenses_list = Expense.query.options(*eager(
+        joinedload(Expense.payer),
+        selectinload(Expense.participants).joinedload(ExpenseParticipant.player)
+    )).order_by(Expense.date.desc()).all()
     return render_template('expenses.html', expenses_list=expenses_list)
 
 @app.route('/add_expense', methods=['GET', 'POST'])
 def add_expense():
-    players = Player.query.all()
+    players = db.session.query(Player.id, Player.name).all()
     if request.method == 'POST':
         description = request.form['description']
         amount = float(request.form['amount'])
@@ -521,10 +736,9 @@ def add_expense():
         db.session.add(new_expense)
         db.session.flush()
 
-        for pid in participant_ids:
-            participant = ExpenseParticipant(expense_id=new_expense.id, player_id=int(pid))
-            db.session.add(participant)
-        
+        bulk_create(ExpenseParticipant, [
+            {'expense_id': new_expense.id, 'player_id': int(pid)} for pid in participant_ids
+        ])
         db.session.commit()
         return redirect(url_for('expenses'))
     return render_template('add_expense.html', players=players)
@@ -532,7 +746,7 @@ def add_expense():
 @app.route('/edit_expense/<int:expense_id>', methods=['GET', 'POST'])
 def edit_expense(expense_id):
     expense = Expense.query.get_or_404(expense_id)
-    players = Player.query.all()
+    players = db.session.query(Player.id, Player.name).all()
     if request.method == 'POST':
         expense.description = request.form['description']
         expense.amount = float(request.form['amount'])
@@ -542,10 +756,9 @@ def edit_expense(expense_id):
         # Update participants
         ExpenseParticipant.query.filter_by(expense_id=expense.id).delete()
         participant_ids = request.form.getlist('participants')
-        for pid in participant_ids:
-            participant = ExpenseParticipant(expense_id=expense.id, player_id=int(pid))
-            db.session.add(participant)
-        
+        bulk_create(ExpenseParticipant, [
+            {'expense_id': expense.id, 'player_id': int(pid)} for pid in participant_ids
+        ])
         db.session.commit()
         return redirect(url_for('expenses'))
     
@@ -554,15 +767,17 @@ def edit_expense(expense_id):
 
 @app.route('/delete_expense/<int:expense_id>')
 def delete_expense(expense_id):
-    expense = Expense.query.get_or_404(expense_id)
-    db.session.delete(expense)
-    db.session.commit()
+    db.session.execute(db.delete(ExpenseParticipant).where(ExpenseParticipant.expense_id == expense_id))
+    delete_or_404(Expense, expense_id)
     flash('Expense deleted', 'success')
     return redirect(url_for('expenses'))
 
 @app.route('/export_expenses')
 def export_expenses():
-    expenses = Expense.query.order_by(Expense.date.desc()).all()
+    expenses = Expense.query.options(*eager(
+        joinedload(Expense.payer),
+        selectinload(Expense.participants).joinedload(ExpenseParticipant.player)
+    )).order_by(Expense.date.desc()).all()
     
     output = StringIO()
     writer = csv.writer(output)
@@ -593,81 +808,96 @@ def export_expenses():
 
 @app.route('/delete_player/<int:player_id>')
 def delete_player(player_id):
-    player = Player.query.get_or_404(player_id)
-    db.session.delete(player)
-    db.session.commit()
+    if db.session.query(Expense.query.filter_by(payer_id=player_id).exists()).scalar():
+        flash('This player paid for expenses. Reassign or delete those expenses first.', 'error')
+        return redirect(url_for('index'))
+    for child in (TravelPlan, CarpoolMember, PlayerRoundScore, ExpenseParticipant):
+        db.session.execute(db.delete(child).where(child.player_id == player_id))
+    delete_or_404(Player, player_id)
+    invalidate_players_cache()
     return redirect(url_for('index'))
 
 @app.route('/settle_up')
 def settle_up():
-    players = Player.query.all()
-    expenses = Expense.query.all()
+    players = db.session.query(Player.id, Player.name).all()
 
     balances = defaultdict(float)
     for player in players:
         balances[player.id] = 0.0
-    
-    for expense in expenses:
-        payer = expense.payer
-        balances[payer.id] += expense.amount
 
-        if expense.participants:
-            share_per_person = expense.amount / len(expense.participants)
-            for participant in expense.participants:
-                balances[participant.player.id] -= share_per_person
+    # Credit each payer with the total they paid
+    paid_totals = db.session.query(Expense.payer_id, func.sum(Expense.amount)).group_by(Expense.payer_id)
+    for payer_id, amount in paid_totals:
+        balances[payer_id] += amount
+
+    # Debit each participant an equal share of every expense they were in
+    participant_counts = db.session.query(
+        ExpenseParticipant.expense_id,
+        func.count(ExpenseParticipant.id).label('participant_count')
+    ).group_by(ExpenseParticipant.expense_id).subquery()
+    owed_totals = (
+        db.session.query(
+            ExpenseParticipant.player_id,
+            func.sum(Expense.amount / participant_counts.c.participant_count)
+        )
+        .join(Expense, Expense.id == ExpenseParticipant.expense_id)
+        .join(participant_counts, participant_counts.c.expense_id == ExpenseParticipant.expense_id)
+        .group_by(ExpenseParticipant.player_id)
+    )
+    for player_id, amount in owed_totals:
+        balances[player_id] -= amount
 
+    # Max-heaps of (-amount, player_id) so the largest debt is always settled
+    # against the largest credit
+    names = {}
     debtors = []
     creditors = []
     for player in players:
-        if balances[player.id] < 0:
-            debtors.append({'player': player, 'amount': abs(balances[player.id])})
-        elif balances[player.id] > 0:
-            creditors.append({'player': player, 'amount': balances[player.id]})
-    
-    transactions = []
-    debtors.sort(key=lambda x: x['amount'], reverse=True)
-    creditors.sort(key=lambda x: x['amount'], reverse=True)
+        names[player.id] = player.name
+        balance = balances[player.id]
+        if balance < 0:
+            debtors.append((balance, player.id))
+        elif balance > 0:
+            creditors.append((-balance, player.id))
+    heapq.heapify(debtors)
+    heapq.heapify(creditors)
 
-    i, j = 0, 0
-    while i < len(debtors) and j < len(creditors):
-        debtor = debtors[i]
-        creditor = creditors[j]
+    transactions = []
+    while debtors and creditors:
+        debt, debtor_id = heapq.heappop(debtors)
+        credit, creditor_id = heapq.heappop(creditors)
+        debt, credit = -debt, -credit
 
-        amount_to_settle = min(debtor['amount'], creditor['amount'])
+        amount_to_settle = min(debt, credit)
         if amount_to_settle > 0.01:
             transactions.append({
-                'from': debtor['player'].name,
-                'to': creditor['player'].name,
+                'from': names[debtor_id],
+                'to': names[creditor_id],
                 'amount': round(amount_to_settle, 2)
             })
 
-            debtor['amount'] -= amount_to_settle
-            creditor['amount'] -= amount_to_settle
+        debt -= amount_to_settle
+        credit -= amount_to_settle
+        if debt >= 0.01:
+            heapq.heappush(debtors, (-debt, debtor_id))
+        if credit >= 0.01:
+            heapq.heappush(creditors, (-credit, creditor_id))
 
-        if debtor['amount'] < 0.01:
-            i += 1
-        if creditor['amount'] < 0.01:
-            j += 1
-
-    return render_template('settle_up.html', players=players, expenses=expenses, balances=balances, transactions=transactions)
+    return render_template('settle_up.html', players=players, balances=balances, transactions=transactions)
 
 
 # --- Match/Competition Routes ---
 @app.route('/matches')
 def matches():
     matches_list = Match.query.order_by(Match.date.desc()).all()
-    players = Player.query.all()
-    players_dict = {p.id: p for p in players}
-    trip_info = get_or_create_trip_info()
-    team_names = trip_info.get_team_names_list()
+    players_dict = get_players_dict()
+    team_names = get_trip_info_data()['team_names']
     
     # Calculate team standings
-    team1_points = sum(m.team1_points or 0 for m in matches_list if m.status == 'completed')
-    team2_points = sum(m.team2_points or 0 for m in matches_list if m.status == 'completed')
+    team1_points, team2_points, _ = get_match_standings()
     
     return render_template('matches.html', 
                           matches=matches_list, 
-                          players=players,
                           players_dict=players_dict,
                           team_names=team_names,
                           team1_points=team1_points,
@@ -675,9 +905,8 @@ def matches():
 
 @app.route('/create_match', methods=['GET', 'POST'])
 def create_match():
-    trip_info = get_or_create_trip_info()
-    team_names = trip_info.get_team_names_list()
-    players = Player.query.all()
+    team_names = get_trip_info_data()['team_names']
+    players = db.session.query(Player.id, Player.name, Player.handicap, Player.team).all()
     
     # Split players by team
     team1_players = [p for p in players if p.team == team_names[0]] if len(team_names) > 0 else []
@@ -685,7 +914,7 @@ def create_match():
     
     if request.method == 'POST':
         format_type = request.form['format']
-        match_date = datetime.strptime(request.form['date'], '%Y-%m-%d')
+        match_date = datetime.fromisoformat(request.form['date'])
         team1_ids = request.form.getlist('team1_players')
         team2_ids = request.form.getlist('team2_players')
         notes = request.form.get('notes', '')
@@ -693,13 +922,14 @@ def create_match():
         new_match = Match(
             format=format_type,
             date=match_date,
-            team1_player_ids=json.dumps([int(id) for id in team1_ids]),
-            team2_player_ids=json.dumps([int(id) for id in team2_ids]),
+            team1_player_ids=[int(id) for id in team1_ids],
+            team2_player_ids=[int(id) for id in team2_ids],
             notes=notes,
             status='scheduled'
         )
         db.session.add(new_match)
         db.session.commit()
+        bump_cache_generation('standings')
         return redirect(url_for('matches'))
     
     return render_template('create_match.html', 
@@ -710,18 +940,17 @@ def create_match():
 @app.route('/edit_match/<int:match_id>', methods=['GET', 'POST'])
 def edit_match(match_id):
     match = Match.query.get_or_404(match_id)
-    trip_info = get_or_create_trip_info()
-    team_names = trip_info.get_team_names_list()
-    players = Player.query.all()
+    team_names = get_trip_info_data()['team_names']
+    players = db.session.query(Player.id, Player.name, Player.handicap, Player.team).all()
     
     team1_players = [p for p in players if p.team == team_names[0]] if len(team_names) > 0 else []
     team2_players = [p for p in players if p.team == team_names[1]] if len(team_names) > 1 else []
     
     if request.method == 'POST':
         match.format = request.form['format']
-        match.date = datetime.strptime(request.form['date'], '%Y-%m-%d')
-        match.team1_player_ids = json.dumps([int(id) for id in request.form.getlist('team1_players')])
-        match.team2_player_ids = json.dumps([int(id) for id in request.form.getlist('team2_players')])
+        match.date = datetime.fromisoformat(request.form['date'])
+        match.team1_player_ids = [int(id) for id in request.form.getlist('team1_players')]
+        match.team2_player_ids = [int(id) for id in request.form.getlist('team2_players')]
         match.status = request.form['status']
         match.notes = request.form.get('notes', '')
         
@@ -740,6 +969,7 @@ def edit_match(match_id):
                 match.team2_points = 0.5
         
         db.session.commit()
+        bump_cache_generation('standings')
         return redirect(url_for('matches'))
     
     return render_template('edit_match.html', 
@@ -747,22 +977,20 @@ def edit_match(match_id):
                           team_names=team_names,
                           team1_players=team1_players,
                           team2_players=team2_players,
-                          current_team1_ids=match.get_team1_players(),
-                          current_team2_ids=match.get_team2_players())
+                          current_team1_ids=match.team1_player_ids,
+                          current_team2_ids=match.team2_player_ids)
 
 @app.route('/delete_match/<int:match_id>')
 def delete_match(match_id):
-    match = Match.query.get_or_404(match_id)
-    db.session.delete(match)
-    db.session.commit()
+    delete_or_404(Match, match_id)
+    bump_cache_generation('standings')
     return redirect(url_for('matches'))
 
 
 # --- Announcement Routes ---
 @app.route('/announcements')
 def announcements():
-    announcements_list = Announcement.query.order_by(Announcement.pinned.desc(), Announcement.created_at.desc()).all()
-    return render_template('announcements.html', announcements=announcements_list)
+    return conditional_page(render_template('announcements.html', announcements=get_announcements_list()))
 
 @app.route('/create_announcement', methods=['GET', 'POST'])
 def create_announcement():
@@ -775,6 +1003,7 @@ def create_announcement():
         new_announcement = Announcement(title=title, content=content, author=author, pinned=pinned)
         db.session.add(new_announcement)
         db.session.commit()
+        bump_cache_generation('ann_list')
         return redirect(url_for('announcements'))
     
     return render_template('create_announcement.html')
@@ -788,14 +1017,14 @@ def edit_announcement(announcement_id):
         announcement.author = request.form.get('author', '')
         announcement.pinned = bool(request.form.get('pinned'))
         db.session.commit()
+        bump_cache_generation('ann_list')
         return redirect(url_for('announcements'))
     return render_template('edit_announcement.html', announcement=announcement)
 
 @app.route('/delete_announcement/<int:announcement_id>')
 def delete_announcement(announcement_id):
-    announcement = Announcement.query.get_or_404(announcement_id)
-    db.session.delete(announcement)
-    db.session.commit()
+    delete_or_404(Announcement, announcement_id)
+    bump_cache_generation('ann_list')
     flash('Announcement deleted', 'success')
     return redirect(url_for('announcements'))
 
@@ -804,43 +1033,35 @@ def delete_announcement(announcement_id):
 @app.route('/schedule')
 def schedule():
     events = ScheduleEvent.query.order_by(ScheduleEvent.event_date, ScheduleEvent.start_time).all()
-    courses = Course.query.all()
     
-    # Group events by date
-    events_by_date = {}
-    for event in events:
-        date_key = event.event_date.strftime('%Y-%m-%d')
-        if date_key not in events_by_date:
-            events_by_date[date_key] = []
-        events_by_date[date_key].append(event)
+    # Already sorted by date, so each day is one contiguous run
+    events_by_date = {
+        day.strftime('%Y-%m-%d'): list(day_events)
+        for day, day_events in groupby(events, key=lambda event: event.event_date.date())
+    }
     
-    return render_template('schedule.html', events=events, events_by_date=events_by_date, courses=courses)
+    return conditional_page(render_template('schedule.html', events_by_date=events_by_date))
+
+# Column values for a ScheduleEvent from the create/edit form
+def parse_event_form(form):
+    course_id = form.get('course_id')
+    return {
+        'title': form['title'],
+        'description': form.get('description', ''),
+        'event_date': datetime.fromisoformat(form['event_date']),
+        'start_time': form.get('start_time', ''),
+        'end_time': form.get('end_time', ''),
+        'location': form.get('location', ''),
+        'event_type': form['event_type'],
+        'course_id': int(course_id) if course_id else None,
+        'notes': form.get('notes', '')
+    }
 
 @app.route('/create_event', methods=['GET', 'POST'])
 def create_event():
-    courses = Course.query.all()
+    courses = get_course_choices()
     if request.method == 'POST':
-        title = request.form['title']
-        description = request.form.get('description', '')
-        event_date = datetime.strptime(request.form['event_date'], '%Y-%m-%d')
-        start_time = request.form.get('start_time', '')
-        end_time = request.form.get('end_time', '')
-        location = request.form.get('location', '')
-        event_type = request.form['event_type']
-        course_id = request.form.get('course_id') if request.form.get('course_id') else None
-        notes = request.form.get('notes', '')
-        
-        new_event = ScheduleEvent(
-            title=title,
-            description=description,
-            event_date=event_date,
-            start_time=start_time,
-            end_time=end_time,
-            location=location,
-            event_type=event_type,
-            course_id=int(course_id) if course_id else None,
-            notes=notes
-        )
+        new_event = ScheduleEvent(**parse_event_form(request.form))
         db.session.add(new_event)
         db.session.commit()
         flash('Event added to schedule!', 'success')
@@ -851,18 +1072,11 @@ def create_event():
 @app.route('/edit_event/<int:event_id>', methods=['GET', 'POST'])
 def edit_event(event_id):
     event = ScheduleEvent.query.get_or_404(event_id)
-    courses = Course.query.all()
+    courses = get_course_choices()
     
     if request.method == 'POST':
-        event.title = request.form['title']
-        event.description = request.form.get('description', '')
-        event.event_date = datetime.strptime(request.form['event_date'], '%Y-%m-%d')
-        event.start_time = request.form.get('start_time', '')
-        event.end_time = request.form.get('end_time', '')
-        event.location = request.form.get('location', '')
-        event.event_type = request.form['event_type']
-        event.course_id = int(request.form.get('course_id')) if request.form.get('course_id') else None
-        event.notes = request.form.get('notes', '')
+        for field, value in parse_event_form(request.form).items():
+            setattr(event, field, value)
         db.session.commit()
         flash('Event updated!', 'success')
         return redirect(url_for('schedule'))
@@ -871,9 +1085,7 @@ def edit_event(event_id):
 
 @app.route('/delete_event/<int:event_id>')
 def delete_event(event_id):
-    event = ScheduleEvent.query.get_or_404(event_id)
-    db.session.delete(event)
-    db.session.commit()
+    delete_or_404(ScheduleEvent, event_id)
     flash('Event deleted', 'success')
     return redirect(url_for('schedule'))
 
@@ -881,22 +1093,15 @@ def delete_event(event_id):
 # --- API endpoint for standings ---
 @app.route('/api/standings')
 def api_standings():
-    matches_list = Match.query.filter_by(status='completed').all()
-    trip_info = get_or_create_trip_info()
-    team_names = trip_info.get_team_names_list()
-    
-    team1_points = sum(m.team1_points or 0 for m in matches_list)
-    team2_points = sum(m.team2_points or 0 for m in matches_list)
-    
-    return jsonify({
-        'team1': {'name': team_names[0] if len(team_names) > 0 else 'Team 1', 'points': team1_points},
-        'team2': {'name': team_names[1] if len(team_names) > 1 else 'Team 2', 'points': team2_points},
-        'matches_played': len(matches_list)
-    })
+    response = Response(orjson.dumps(get_standings_payload()), mimetype='application/json')
+    # Scoreboards poll this; an unchanged payload costs a 304 instead of a body
+    response.add_etag()
+    response.cache_control.max_age = 10
+    return response.make_conditional(request)
 
 
 if __name__ == '__main__':
     with app.app_context():
-        db.create_all()
-    app.run(debug=True)
+        run_migrations()
+    app.run(debug=debug_mode)
 
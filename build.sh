@@ -1,3 +1,3 @@
 #!/usr/bin/env bash
 pip install -r requirements.txt
-python -c "from app import app, db; app.app_context().push(); db.create_all()"
+python -c "from app import app, run_migrations; app.app_context().push(); run_migrations()"
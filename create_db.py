@@ -1,4 +1,4 @@
-from app import db, app
+from app import app, run_migrations
 
 with app.app_context():
-    db.create_all()
+    run_migrations()
@@ -0,0 +1,5 @@
+# Production entrypoint:
+#   gunicorn --worker-class gthread --workers 1 --threads 8 wsgi:app
+# Stay on a single worker process: the trip, player and standings caches live
+# in process memory and are only invalidated in the process that wrote.
+from app import app